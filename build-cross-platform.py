@@ -14,7 +14,6 @@ def install_dependencies():
     """Install required build dependencies"""
     dependencies = [
         "pyinstaller",
-        "psutil",
         "pillow"
     ]
     
@@ -53,7 +52,7 @@ jobs:
     - name: Install dependencies
       run: |
         python -m pip install --upgrade pip
-        pip install pyinstaller tkinter psutil pillow pywin32
+        pip install pyinstaller tkinter pillow pywin32
     
     - name: Create assets directory
       run: |
@@ -62,7 +61,7 @@ jobs:
     
     - name: Build Windows GUI executable
       run: |
-        pyinstaller --onefile --windowed --name cleanshift --add-data "cleanshift;cleanshift" --add-data "assets;assets" --hidden-import tkinter --hidden-import PIL --hidden-import psutil --hidden-import win32api --hidden-import win32file cleanshift/main.py
+        pyinstaller --onefile --windowed --name cleanshift --add-data "cleanshift;cleanshift" --add-data "assets;assets" --hidden-import tkinter --hidden-import PIL --hidden-import win32api cleanshift/main.py
     
     - name: Test executable exists
       run: |
@@ -207,7 +206,6 @@ def main():
             "--add-data", "cleanshift;cleanshift",
             "--hidden-import", "tkinter",
             "--hidden-import", "PIL",
-            "--hidden-import", "psutil",
             "cleanshift/main.py"
         ]
         
@@ -40,9 +40,7 @@ def build_executable():
         "--hidden-import", "PIL",
         "--hidden-import", "PIL.Image",
         "--hidden-import", "PIL.ImageTk",
-        "--hidden-import", "psutil",
         "--hidden-import", "win32api",
-        "--hidden-import", "win32file",
         "--hidden-import", "win32con",
         "--exclude-module", "click",
         "--exclude-module", "rich",
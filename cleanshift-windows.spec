@@ -13,10 +13,8 @@ a = Analysis(
         'click',
         'rich.console',
         'rich.table', 
-        'psutil',
         'colorama',
         'win32api',
-        'win32file',
         'win32com.client',
         'winreg',
     ],
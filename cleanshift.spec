@@ -18,9 +18,7 @@ a = Analysis(
         'PIL',
         'PIL.Image',
         'PIL.ImageTk',
-        'psutil',
         'win32api',
-        'win32file',
         'win32com.client',
         'threading',
         'webbrowser',
@@ -0,0 +1,103 @@
+import ctypes
+import sys
+
+# sys.platform is fixed at build time, unlike platform.system() which probes the OS
+IS_WINDOWS = sys.platform == "win32"
+
+# GetDriveTypeW result for a hard disk or SSD
+DRIVE_FIXED = 3
+
+class COPYFILE2_EXTENDED_PARAMETERS(ctypes.Structure):
+    """Extended parameters for CopyFile2"""
+    _fields_ = [
+        ("dwSize", ctypes.c_ulong),
+        ("dwCopyFlags", ctypes.c_ulong),
+        ("pfCancel", ctypes.c_void_p),
+        ("pProgressRoutine", ctypes.c_void_p),
+        ("pvCallbackContext", ctypes.c_void_p),
+    ]
+
+# kernel32 and shell32 are loaded once here and every entry point is bound with an explicit signature
+if IS_WINDOWS:
+    from ctypes import wintypes
+    
+    class WIN32_FIND_DATAW(ctypes.Structure):
+        """Directory entry filled in by FindFirstFileExW / FindNextFileW"""
+        _fields_ = [
+            ("dwFileAttributes", wintypes.DWORD),
+            ("ftCreationTime", wintypes.FILETIME),
+            ("ftLastAccessTime", wintypes.FILETIME),
+            ("ftLastWriteTime", wintypes.FILETIME),
+            ("nFileSizeHigh", wintypes.DWORD),
+            ("nFileSizeLow", wintypes.DWORD),
+            ("dwReserved0", wintypes.DWORD),  # Reparse tag for reparse points
+            ("dwReserved1", wintypes.DWORD),
+            ("cFileName", wintypes.WCHAR * 260),
+            ("cAlternateFileName", wintypes.WCHAR * 14),
+        ]
+    
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    
+    # Drives
+    GetLogicalDriveStringsW = kernel32.GetLogicalDriveStringsW
+    GetLogicalDriveStringsW.argtypes = [wintypes.DWORD, wintypes.LPWSTR]
+    GetLogicalDriveStringsW.restype = wintypes.DWORD
+    
+    GetDriveTypeW = kernel32.GetDriveTypeW
+    GetDriveTypeW.argtypes = [wintypes.LPCWSTR]
+    GetDriveTypeW.restype = wintypes.UINT
+    
+    GetDiskFreeSpaceExW = kernel32.GetDiskFreeSpaceExW
+    GetDiskFreeSpaceExW.argtypes = [wintypes.LPCWSTR, ctypes.POINTER(ctypes.c_ulonglong),
+                                    ctypes.POINTER(ctypes.c_ulonglong), ctypes.POINTER(ctypes.c_ulonglong)]
+    GetDiskFreeSpaceExW.restype = wintypes.BOOL
+    
+    # Directory listing
+    FindFirstFileExW = kernel32.FindFirstFileExW
+    FindFirstFileExW.argtypes = [wintypes.LPCWSTR, ctypes.c_int, ctypes.POINTER(WIN32_FIND_DATAW),
+                                 ctypes.c_int, ctypes.c_void_p, wintypes.DWORD]
+    FindFirstFileExW.restype = wintypes.HANDLE
+    
+    FindNextFileW = kernel32.FindNextFileW
+    FindNextFileW.argtypes = [wintypes.HANDLE, ctypes.POINTER(WIN32_FIND_DATAW)]
+    FindNextFileW.restype = wintypes.BOOL
+    
+    FindClose = kernel32.FindClose
+    FindClose.argtypes = [wintypes.HANDLE]
+    FindClose.restype = wintypes.BOOL
+    
+    # Moving, copying and linking
+    MoveFileExW = kernel32.MoveFileExW
+    MoveFileExW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD]
+    MoveFileExW.restype = wintypes.BOOL
+    
+    # Windows 8+; callers fall back to shutil.copy2 without it
+    CopyFile2 = getattr(kernel32, "CopyFile2", None)
+    if CopyFile2 is not None:
+        CopyFile2.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR,
+                              ctypes.POINTER(COPYFILE2_EXTENDED_PARAMETERS)]
+        CopyFile2.restype = ctypes.c_long  # HRESULT, checked by hand
+    
+    CreateSymbolicLinkW = kernel32.CreateSymbolicLinkW
+    CreateSymbolicLinkW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD]
+    CreateSymbolicLinkW.restype = wintypes.BOOLEAN
+    
+    # Resolving link targets
+    CreateFileW = kernel32.CreateFileW
+    CreateFileW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, ctypes.c_void_p,
+                            wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE]
+    CreateFileW.restype = wintypes.HANDLE
+    
+    GetFinalPathNameByHandleW = kernel32.GetFinalPathNameByHandleW
+    GetFinalPathNameByHandleW.argtypes = [wintypes.HANDLE, wintypes.LPWSTR,
+                                          wintypes.DWORD, wintypes.DWORD]
+    GetFinalPathNameByHandleW.restype = wintypes.DWORD
+    
+    CloseHandle = kernel32.CloseHandle
+    CloseHandle.argtypes = [wintypes.HANDLE]
+    CloseHandle.restype = wintypes.BOOL
+    
+    # Elevation check
+    IsUserAnAdmin = ctypes.WinDLL("shell32").IsUserAnAdmin
+    IsUserAnAdmin.argtypes = []
+    IsUserAnAdmin.restype = wintypes.BOOL
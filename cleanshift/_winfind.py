@@ -0,0 +1,54 @@
+import ctypes
+from typing import Iterator, Tuple
+
+try:
+    from ._win32 import WIN32_FIND_DATAW, FindFirstFileExW, FindNextFileW, FindClose
+except ImportError:
+    from _win32 import WIN32_FIND_DATAW, FindFirstFileExW, FindNextFileW, FindClose
+
+# FindFirstFileExW options: skip 8.3 names and fetch entries in large batches
+FIND_EX_INFO_BASIC = 1
+FIND_EX_SEARCH_NAME_MATCH = 0
+FIND_FIRST_EX_LARGE_FETCH = 0x2
+
+FILE_ATTRIBUTE_DIRECTORY = 0x10
+FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+
+# Reparse tags that os.readlink understands
+IO_REPARSE_TAG_MOUNT_POINT = 0xA0000003
+IO_REPARSE_TAG_SYMLINK = 0xA000000C
+
+ERROR_FILE_NOT_FOUND = 2
+ERROR_NO_MORE_FILES = 18
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+def iter_dir(path: str) -> Iterator[Tuple[str, int, int, int, int]]:
+    """Yield (name, attributes, size_high, size_low, reparse_tag) for a directory"""
+    data = WIN32_FIND_DATAW()
+    handle = FindFirstFileExW(path.rstrip("\\/") + "\\*", FIND_EX_INFO_BASIC, ctypes.byref(data),
+                               FIND_EX_SEARCH_NAME_MATCH, None, FIND_FIRST_EX_LARGE_FETCH)
+    if handle == INVALID_HANDLE_VALUE:
+        error = ctypes.get_last_error()
+        if error == ERROR_FILE_NOT_FOUND:
+            return
+        raise ctypes.WinError(error)
+
+    try:
+        while True:
+            name = data.cFileName
+            if name not in (".", ".."):
+                yield (name, data.dwFileAttributes, data.nFileSizeHigh,
+                       data.nFileSizeLow, data.dwReserved0)
+
+            if not FindNextFileW(handle, ctypes.byref(data)):
+                error = ctypes.get_last_error()
+                if error != ERROR_NO_MORE_FILES:
+                    raise ctypes.WinError(error)
+                return
+    finally:
+        FindClose(handle)
+
+def is_link(attributes: int, reparse_tag: int) -> bool:
+    """Check whether a find entry is a symlink or junction"""
+    return bool(attributes & FILE_ATTRIBUTE_REPARSE_POINT) and \
+        reparse_tag in (IO_REPARSE_TAG_SYMLINK, IO_REPARSE_TAG_MOUNT_POINT)
@@ -1,9 +1,40 @@
 import os
-import psutil
+import ctypes
+import queue
+import threading
 from pathlib import Path
-from typing import List, Dict
-import win32api
-import win32file
+from typing import List, Dict, Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from . import _win32
+except ImportError:
+    import _win32
+
+def get_tree_size(path: str, cancel: threading.Event = None) -> int:
+    """Calculate total size of a directory tree from os.scandir entries"""
+    total_size = 0
+    pending = [path]
+    
+    while pending:
+        if cancel is not None and cancel.is_set():
+            break
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    try:
+                        # DirEntry type and stat() come from the directory listing
+                        # itself on Windows, so no extra syscall per file
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total_size += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    
+    return total_size
 
 class DiskAnalyzer:
     """Analyzes disk usage and identifies large folders"""
@@ -23,71 +54,130 @@ class DiskAnalyzer:
     def get_drive_info(self) -> List[Dict]:
         """Get information about all available drives"""
         drives = []
-        drive_bits = win32file.GetLogicalDrives()
         
-        for i in range(26):
-            mask = 1 << i
-            if drive_bits & mask:
-                drive_letter = chr(ord('A') + i) + ':\\'
-                try:
-                    drive_type = win32file.GetDriveType(drive_letter)
-                    if drive_type == win32file.DRIVE_FIXED:  # Only fixed drives
-                        usage = psutil.disk_usage(drive_letter)
-                        drives.append({
-                            'drive': drive_letter,
-                            'total': usage.total,
-                            'used': usage.used,
-                            'free': usage.free,
-                            'usage_percent': (usage.used / usage.total) * 100
-                        })
-                except:
-                    continue
+        # One call returns every drive root as a NUL-separated list
+        buffer = ctypes.create_unicode_buffer(255)
+        length = _win32.GetLogicalDriveStringsW(len(buffer), buffer)
+        
+        free_to_caller = ctypes.c_ulonglong()
+        total = ctypes.c_ulonglong()
+        free = ctypes.c_ulonglong()
+        
+        for drive_letter in buffer[:length].split('\0'):
+            # Only fixed drives
+            if not drive_letter or _win32.GetDriveTypeW(drive_letter) != _win32.DRIVE_FIXED:
+                continue
+            if not _win32.GetDiskFreeSpaceExW(drive_letter, ctypes.byref(free_to_caller), 
+                                              ctypes.byref(total), ctypes.byref(free)):
+                continue
+            if not total.value:
+                continue
+            
+            used = total.value - free.value
+            drives.append({
+                'drive': drive_letter,
+                'total': total.value,
+                'used': used,
+                'free': free.value,
+                'usage_percent': (used / total.value) * 100
+            })
         
         return drives
     
     def scan_directory(self, path: str, min_size: int = 100 * 1024 * 1024) -> List[Dict]:
         """Scan directory for large folders"""
-        results = []
+        results = self.iter_large_folders_parallel(path, min_size)
+        return sorted(results, key=lambda x: x['size'], reverse=True)
+    
+    def iter_large_folders_parallel(self, path: str, min_size: int = 100 * 1024 * 1024, 
+                                    max_workers: int = None, 
+                                    cancel: threading.Event = None) -> Iterator[Dict]:
+        """Yield large folders under path, walking each top-level subfolder on its own thread
+        
+        Setting cancel, or closing the generator, stops the walkers at their next folder.
+        """
+        if self._is_system_critical(path):
+            return
+        
+        try:
+            with os.scandir(path) as entries:
+                subdirs = [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
+        except OSError as e:
+            print(f"Error scanning {path}: {e}")
+            return
+        
+        if cancel is None:
+            cancel = threading.Event()
+        
+        # Workers push results as they find them; None marks a finished task
+        results = queue.Queue()
         
+        def size_root():
+            try:
+                folder_size = get_tree_size(path, cancel)
+                if folder_size >= min_size and not cancel.is_set():
+                    results.put({
+                        'path': path,
+                        'size': folder_size,
+                        'type': self._identify_folder_type(path)
+                    })
+            finally:
+                results.put(None)
+        
+        def walk(subdir):
+            try:
+                for result in self.iter_large_folders(subdir, min_size, cancel):
+                    results.put(result)
+            finally:
+                results.put(None)
+        
+        # Directory walking waits on the disk, not the GIL, so use more threads than cores
+        workers = max_workers or (os.cpu_count() or 1) * 2
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(size_root)]
+            futures.extend(executor.submit(walk, subdir) for subdir in subdirs)
+            
+            try:
+                pending = len(futures)
+                while pending and not cancel.is_set():
+                    result = results.get()
+                    if result is None:
+                        pending -= 1
+                    else:
+                        yield result
+            finally:
+                # shutdown(cancel_futures=True) needs Python 3.9, so drop queued tasks by hand
+                cancel.set()
+                for future in futures:
+                    future.cancel()
+    
+    def iter_large_folders(self, path: str, min_size: int = 100 * 1024 * 1024, 
+                           cancel: threading.Event = None) -> Iterator[Dict]:
+        """Yield large folders under path as they are found, in walk order"""
         try:
             for root, dirs, files in os.walk(path):
+                if cancel is not None and cancel.is_set():
+                    return
+                
                 # Skip system-critical directories
                 if self._is_system_critical(root):
                     dirs.clear()  # Don't recurse into system directories
                     continue
                 
                 try:
-                    folder_size = self._get_folder_size(root)
+                    folder_size = get_tree_size(root, cancel)
                     if folder_size >= min_size:
                         folder_type = self._identify_folder_type(root)
-                        results.append({
+                        yield {
                             'path': root,
                             'size': folder_size,
                             'type': folder_type
-                        })
+                        }
                 except (PermissionError, OSError):
                     continue
         
         except Exception as e:
             print(f"Error scanning {path}: {e}")
-        
-        return sorted(results, key=lambda x: x['size'], reverse=True)
-    
-    def _get_folder_size(self, path: str) -> int:
-        """Calculate total size of a folder"""
-        total_size = 0
-        try:
-            for dirpath, dirnames, filenames in os.walk(path):
-                for filename in filenames:
-                    filepath = os.path.join(dirpath, filename)
-                    try:
-                        total_size += os.path.getsize(filepath)
-                    except (OSError, FileNotFoundError):
-                        continue
-        except (PermissionError, OSError):
-            pass
-        
-        return total_size
     
     def _identify_folder_type(self, path: str) -> str:
         """Identify the type of folder based on path patterns"""
@@ -6,6 +6,18 @@ from pathlib import Path
 from typing import List
 import win32api
 
+try:
+    from .analyzer import get_tree_size
+except ImportError:
+    from analyzer import get_tree_size
+
+def _remove_tree(path: str) -> None:
+    """Delete a directory tree, skipping anything locked or protected"""
+    shutil.rmtree(path, ignore_errors=True)
+
+def _keep(path: str) -> None:
+    """Stand-in for a delete during a dry run"""
+
 class SystemCleaner:
     """Handles cleaning of temporary files and system caches"""
     
@@ -27,6 +39,9 @@ class SystemCleaner:
     def clean_temp_files(self, dry_run: bool = False) -> int:
         """Clean temporary files from system temp directories"""
         total_freed = 0
+        # Pick the delete operations once rather than testing dry_run per item
+        remove_file = _keep if dry_run else os.remove
+        remove_tree = _keep if dry_run else _remove_tree
         
         for temp_path in self.temp_paths:
             if not temp_path or not os.path.exists(temp_path):
@@ -38,13 +53,11 @@ class SystemCleaner:
                     try:
                         if os.path.isfile(item_path):
                             size = os.path.getsize(item_path)
-                            if not dry_run:
-                                os.remove(item_path)
+                            remove_file(item_path)
                             total_freed += size
                         elif os.path.isdir(item_path):
                             size = self._get_directory_size(item_path)
-                            if not dry_run:
-                                shutil.rmtree(item_path, ignore_errors=True)
+                            remove_tree(item_path)
                             total_freed += size
                     except (PermissionError, OSError):
                         continue
@@ -56,6 +69,7 @@ class SystemCleaner:
     def clean_browser_cache(self, dry_run: bool = False) -> int:
         """Clean browser cache files"""
         total_freed = 0
+        remove_tree = _keep if dry_run else _remove_tree
         
         for cache_path in self.browser_cache_paths:
             if not os.path.exists(cache_path):
@@ -68,14 +82,12 @@ class SystemCleaner:
                         profile_cache = os.path.join(cache_path, profile, 'cache2')
                         if os.path.exists(profile_cache):
                             size = self._get_directory_size(profile_cache)
-                            if not dry_run:
-                                shutil.rmtree(profile_cache, ignore_errors=True)
+                            remove_tree(profile_cache)
                             total_freed += size
                 else:
                     # Handle Chrome/Edge cache
                     size = self._get_directory_size(cache_path)
-                    if not dry_run:
-                        shutil.rmtree(cache_path, ignore_errors=True)
+                    remove_tree(cache_path)
                     total_freed += size
             except (PermissionError, OSError):
                 continue
@@ -139,16 +151,4 @@ class SystemCleaner:
     
     def _get_directory_size(self, path: str) -> int:
         """Calculate total size of a directory"""
-        total_size = 0
-        try:
-            for dirpath, dirnames, filenames in os.walk(path):
-                for filename in filenames:
-                    filepath = os.path.join(dirpath, filename)
-                    try:
-                        total_size += os.path.getsize(filepath)
-                    except (OSError, FileNotFoundError):
-                        continue
-        except (PermissionError, OSError):
-            pass
-        
-        return total_size
+        return get_tree_size(path)
@@ -4,6 +4,11 @@ from pathlib import Path
 from typing import List, Dict
 import subprocess
 
+try:
+    from .analyzer import get_tree_size
+except ImportError:
+    from analyzer import get_tree_size
+
 class EnvironmentCleaner:
     """Handles cleaning of development environments"""
     
@@ -141,19 +146,7 @@ class EnvironmentCleaner:
     
     def _get_directory_size(self, path: str) -> int:
         """Calculate total size of a directory"""
-        total_size = 0
-        try:
-            for dirpath, dirnames, filenames in os.walk(path):
-                for filename in filenames:
-                    filepath = os.path.join(dirpath, filename)
-                    try:
-                        total_size += os.path.getsize(filepath)
-                    except (OSError, FileNotFoundError):
-                        continue
-        except (PermissionError, OSError):
-            pass
-        
-        return total_size
+        return get_tree_size(path)
     
     def get_environment_suggestions(self, environments: List[Dict]) -> List[Dict]:
         """Get cleanup suggestions for environments"""
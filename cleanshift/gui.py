@@ -1,27 +1,33 @@
-```python
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import threading
 import os
 import sys
 from pathlib import Path
-from PIL import Image, ImageTk
-import platform
+
+# Try to import PIL for logo, fallback if not available
+try:
+    from PIL import Image, ImageTk
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
 
 # Import modules with fallback
 try:
     from .analyzer import DiskAnalyzer
     from .cleaner import SystemCleaner
     from .mover import PackageMover
-    from .utils import is_admin, format_size
+    from .utils import is_admin, format_size, get_asset_path, bulk_insert
     from .env_cleaner import EnvironmentCleaner
+    from .gui_callbacks import GUICallbacks
 except ImportError:
     try:
         from analyzer import DiskAnalyzer
         from cleaner import SystemCleaner
         from mover import PackageMover
-        from utils import is_admin, format_size
+        from utils import is_admin, format_size, get_asset_path, bulk_insert
         from env_cleaner import EnvironmentCleaner
+        from gui_callbacks import GUICallbacks
     except ImportError:
         # Create minimal implementations
         class DiskAnalyzer:
@@ -44,8 +50,50 @@ except ImportError:
         
         def is_admin(): return True
         def format_size(size): return f"{size} B"
+        def get_asset_path(name): return None
+        def bulk_insert(tree, rows):
+            for text, values in rows:
+                tree.insert("", "end", text=text, values=values)
+        
+        class GUICallbacks:
+            pass
+
+# Text shown on the About tab
+ABOUT_TEXT = """
+CleanShift is a comprehensive system cleanup and optimization tool designed to:
+
+• Clean temporary files, cache, and system junk
+• Analyze disk usage and suggest optimizations  
+• Move applications to free up C: drive space
+• Manage development environments
+• Optimize system performance
+
+Features:
+✓ Safe file operations with preview mode
+✓ Intelligent application moving with symlinks
+✓ Development environment cleanup
+✓ Modern, intuitive interface
+✓ System-wide installation option
+
+Created with ❤️ for Windows users who want to keep their systems clean and optimized.
+"""
+
+# Cleaning options shown on the Clean tab: (section title, ((label, key, description), ...))
+CLEAN_SECTIONS = (
+    ("System Files", (
+        ("Temporary Files", "clean_temp", "Clean system and user temp files"),
+        ("Browser Cache", "clean_browser", "Clear browser cache files"),
+        ("System Cache", "clean_system", "Clear Windows system cache"),
+        ("Recycle Bin", "clean_recycle", "Empty recycle bin"),
+    )),
+    ("Memory & Performance", (
+        ("RAM Cache", "clean_ram", "Clear RAM cache and optimize memory"),
+        ("DNS Cache", "clean_dns", "Flush DNS cache"),
+        ("Registry Cleanup", "clean_registry", "Clean invalid registry entries"),
+    )),
+)
 
-class CleanShiftGUI:
+class CleanShiftGUI(GUICallbacks):
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("CleanShift - System Cleanup & Optimizer")
@@ -75,6 +123,17 @@ class CleanShiftGUI:
         self.mover = PackageMover()
         self.env_cleaner = EnvironmentCleaner()
         
+        # Cleaning option checkbox state, keyed by option key
+        self.clean_vars = {}
+        
+        # Preferences; confirm_actions is mirrored into a plain attribute so
+        # handlers don't need a Tcl round trip to read it
+        self.auto_clean = tk.BooleanVar()
+        self.confirm_actions = tk.BooleanVar(value=True)
+        self._confirm_actions = True
+        self.confirm_actions.trace_add(
+            "write", lambda *args: setattr(self, '_confirm_actions', self.confirm_actions.get()))
+        
         self.setup_styles()
         self.create_widgets()
         self.check_admin_status()
@@ -162,18 +221,8 @@ class CleanShiftGUI:
         header_frame.pack_propagate(False)
         
         # Logo
-        try:
-            logo_path = Path(__file__).parent.parent / "assets" / "logo.png"
-            if logo_path.exists():
-                img = Image.open(logo_path)
-                img = img.resize((64, 64), Image.Resampling.LANCZOS)
-                self.logo = ImageTk.PhotoImage(img)
-                logo_label = tk.Label(header_frame, image=self.logo, bg=self.colors['white'])
-                logo_label.pack(side='left', padx=20, pady=8)
-        except Exception:
-            # Fallback logo
-            logo_label = tk.Label(header_frame, text="🚀", font=('Arial', 32), bg=self.colors['white'])
-            logo_label.pack(side='left', padx=20, pady=8)
+        logo_label = self._load_logo(header_frame)
+        logo_label.pack(side='left', padx=20, pady=8)
         
         # Title and description
         title_frame = tk.Frame(header_frame, bg=self.colors['white'])
@@ -197,6 +246,29 @@ class CleanShiftGUI:
                                    bg=self.colors['white'])
         self.admin_label.pack(side='right', padx=20, pady=8)
     
+    def _load_logo(self, parent):
+        """Create the logo label, using the emoji fallback when the image can't be loaded"""
+        if not PIL_AVAILABLE:
+            return self._fallback_logo(parent)
+        
+        logo_path = get_asset_path("logo.png")
+        if logo_path is None:
+            return self._fallback_logo(parent)
+        
+        try:
+            img = Image.open(logo_path)
+            img = img.resize((64, 64), getattr(Image, "Resampling", Image).LANCZOS)
+        except OSError:
+            # Unreadable or corrupt image file
+            return self._fallback_logo(parent)
+        
+        self.logo = ImageTk.PhotoImage(img)
+        return tk.Label(parent, image=self.logo, bg=self.colors['white'])
+    
+    def _fallback_logo(self, parent):
+        """Create the emoji logo label"""
+        return tk.Label(parent, text="🚀", font=('Arial', 32), bg=self.colors['white'])
+    
     def create_dashboard_tab(self):
         """Create dashboard overview tab"""
         tab_frame = tk.Frame(self.notebook, bg=self.colors['gray_50'])
@@ -250,11 +322,6 @@ class CleanShiftGUI:
         scrollbar = ttk.Scrollbar(tab_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = tk.Frame(canvas, bg=self.colors['gray_50'])
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
@@ -262,18 +329,8 @@ class CleanShiftGUI:
         scrollbar.pack(side="right", fill="y")
         
         # Clean options
-        self.create_clean_section(scrollable_frame, "System Files", [
-            ("Temporary Files", "clean_temp", "Clean system and user temp files"),
-            ("Browser Cache", "clean_browser", "Clear browser cache files"),
-            ("System Cache", "clean_system", "Clear Windows system cache"),
-            ("Recycle Bin", "clean_recycle", "Empty recycle bin"),
-        ])
-        
-        self.create_clean_section(scrollable_frame, "Memory & Performance", [
-            ("RAM Cache", "clean_ram", "Clear RAM cache and optimize memory"),
-            ("DNS Cache", "clean_dns", "Flush DNS cache"),
-            ("Registry Cleanup", "clean_registry", "Clean invalid registry entries"),
-        ])
+        for title, options in CLEAN_SECTIONS:
+            self.create_clean_section(scrollable_frame, title, options)
         
         # Clean all button
         clean_all_frame = tk.Frame(scrollable_frame, bg=self.colors['gray_50'])
@@ -285,6 +342,14 @@ class CleanShiftGUI:
         
         ttk.Button(clean_all_frame, text="Preview Changes", 
                   command=self.preview_clean).pack(side='left')
+        
+        # Bind the scrollregion updater only once all sections are built, so
+        # adding each child doesn't trigger a full bbox("all") recalculation
+        scrollable_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        )
+        canvas.configure(scrollregion=canvas.bbox("all"))
     
     def create_analyze_tab(self):
         """Create disk analysis tab"""
@@ -463,11 +528,9 @@ class CleanShiftGUI:
         settings_frame = ttk.LabelFrame(tab_frame, text="Preferences", padding=20)
         settings_frame.pack(fill='x', padx=20, pady=(0, 20))
         
-        self.auto_clean = tk.BooleanVar()
         tk.Checkbutton(settings_frame, text="Enable automatic cleanup on startup", 
                       variable=self.auto_clean, bg=self.colors['white']).pack(anchor='w')
         
-        self.confirm_actions = tk.BooleanVar(value=True)
         tk.Checkbutton(settings_frame, text="Confirm before performing actions", 
                       variable=self.confirm_actions, bg=self.colors['white']).pack(anchor='w')
         
@@ -492,26 +555,7 @@ class CleanShiftGUI:
                 fg=self.colors['gray_600'], 
                 bg=self.colors['white']).pack(pady=(0, 20))
         
-        about_text = """
-CleanShift is a comprehensive system cleanup and optimization tool designed to:
-
-• Clean temporary files, cache, and system junk
-• Analyze disk usage and suggest optimizations  
-• Move applications to free up C: drive space
-• Manage development environments
-• Optimize system performance
-
-Features:
-✓ Safe file operations with preview mode
-✓ Intelligent application moving with symlinks
-✓ Development environment cleanup
-✓ Modern, intuitive interface
-✓ System-wide installation option
-
-Created with ❤️ for Windows users who want to keep their systems clean and optimized.
-        """
-        
-        tk.Label(about_frame, text=about_text, 
+        tk.Label(about_frame, text=ABOUT_TEXT, 
                 font=('Arial', 10), 
                 fg=self.colors['gray_700'], 
                 bg=self.colors['white'],
@@ -530,15 +574,14 @@ Created with ❤️ for Windows users who want to keep their systems clean and o
     # Callback methods for button actions
     def quick_clean(self):
         """Perform a quick clean of common junk files"""
-        cleaner = SystemCleaner()
-        total_freed = cleaner.clean_temp_files() + cleaner.clean_browser_cache() + cleaner.clean_system_cache()
+        total_freed = (self.cleaner.clean_temp_files() + self.cleaner.clean_browser_cache() + 
+                       self.cleaner.clean_system_cache())
         messagebox.showinfo("Quick Clean", f"Quick clean completed. Freed up: {format_size(total_freed)}")
         self.refresh_dashboard()
     
     def quick_analyze(self):
         """Perform a quick analysis of disk usage"""
-        analyzer = DiskAnalyzer()
-        results = analyzer.scan_directory("C:\\", 100 * 1024 * 1024)  # 100 MB threshold
+        results = self.analyzer.scan_directory("C:\\", 100 * 1024 * 1024)  # 100 MB threshold
         
         if not results:
             messagebox.showinfo("Quick Analyze", "No large folders found over 100 MB.")
@@ -576,37 +619,22 @@ Created with ❤️ for Windows users who want to keep their systems clean and o
             return
         
         # Clear previous results
-        for item in self.analysis_tree.get_children():
-            self.analysis_tree.delete(item)
+        self.analysis_tree.delete(*self.analysis_tree.get_children())
         
         def analyze():
             """Run the analysis and update the UI"""
-            analyzer = DiskAnalyzer()
-            results = analyzer.scan_directory(path, 100 * 1024 * 1024)  # 100 MB threshold
+            results = self.analyzer.scan_directory(path, 100 * 1024 * 1024)  # 100 MB threshold
             
-            for result in results:
-                self.analysis_tree.insert("", "end", text=result['path'], values=(format_size(result['size']), result['type'], ""))
-            
-            messagebox.showinfo("Analysis Complete", f"Analysis complete. Found {len(results)} folders over 100 MB.")
+            # Format rows here, then hand them to the Tk thread as one batch
+            rows = [(result['path'], (format_size(result['size']), result['type'], ""))
+                    for result in results]
+            self.root.after(0, bulk_insert, self.analysis_tree, rows)
+            self.root.after(0, messagebox.showinfo, "Analysis Complete", 
+                            f"Analysis complete. Found {len(results)} folders over 100 MB.")
         
         # Run in a separate thread to avoid blocking the UI
         threading.Thread(target=analyze, daemon=True).start()
     
-    def scan_movable_apps(self):
-        """Scan for applications that can be moved to another drive"""
-        # For demo, just show some dummy data
-        for item in self.movable_tree.get_children():
-            self.movable_tree.delete(item)
-        
-        dummy_apps = [
-            {"name": "App1", "size": 250 * 1024 * 1024, "location": "C:\\Program Files\\App1", "target": "D:\\Apps\\App1", "status": "Ready to move"},
-            {"name": "App2", "size": 150 * 1024 * 1024, "location": "C:\\Program Files\\App2", "target": "D:\\Apps\\App2", "status": "Ready to move"},
-            {"name": "App3", "size": 500 * 1024 * 1024, "location": "C:\\Program Files\\App3", "target": "E:\\Apps\\App3", "status": "Ready to move"},
-        ]
-        
-        for app in dummy_apps:
-            self.movable_tree.insert("", "end", text=app['name'], values=(format_size(app['size']), app['location'], app['target'], app['status']))
-    
     def move_selected_apps(self):
         """Move the selected applications to the target location"""
         selected_items = self.movable_tree.selection()
@@ -639,8 +667,7 @@ Created with ❤️ for Windows users who want to keep their systems clean and o
     def scan_environments(self):
         """Scan for development environments to clean"""
         # For demo, just show some dummy data
-        for item in self.env_tree.get_children():
-            self.env_tree.delete(item)
+        self.env_tree.delete(*self.env_tree.get_children())
         
         dummy_envs = [
             {"name": "Node.js 14.x", "type": "Node.js", "size": 300 * 1024 * 1024, "path": "C:\\Program Files\\Nodejs", "action": "Remove"},
@@ -697,4 +724,3 @@ Created with ❤️ for Windows users who want to keep their systems clean and o
 if __name__ == "__main__":
     app = CleanShiftGUI()
     app.run()
-```
\ No newline at end of file
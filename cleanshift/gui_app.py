@@ -1,47 +1,151 @@
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, messagebox, filedialog
 import threading
+import queue
+import time
 import os
-import sys
-import platform
-import webbrowser
-import subprocess
-import shutil
-from pathlib import Path
-
-# Try to import PIL for logo, fallback if not available
-try:
-    from PIL import Image, ImageTk
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Import our modules (should be available after setup_imports)
 from analyzer import DiskAnalyzer
 from cleaner import SystemCleaner
 from mover import PackageMover
 from env_cleaner import EnvironmentCleaner
-from utils import is_admin, format_size
+from utils import is_admin, format_size, get_asset_path, load_scan_cache, save_scan_cache, \
+    clear_scan_cache, bulk_insert, SYSTEM_DRIVE, suggestion_keywords
+
+# Initial main window size in pixels
+WINDOW_WIDTH = 1200
+WINDOW_HEIGHT = 800
+
+# Seconds a get_drive_info() result is reused by refresh_dashboard
+DRIVES_CACHE_TTL = 3.0
+
+# Value columns of the results tree; _size_bytes is hidden
+RESULT_COLUMNS = ("size", "type", "suggestion", "_size_bytes")
+
+def _row_sort_key(column):
+    """Build a sort key for (path, values) result rows"""
+    if column == "#0":
+        return lambda row: row[0].lower()
+    if column == "size":
+        # Sizes sort on the raw byte count, not the formatted text
+        index = RESULT_COLUMNS.index("_size_bytes")
+        return lambda row: row[1][index]
+    index = RESULT_COLUMNS.index(column)
+    return lambda row: row[1][index].lower()
+
+# Text shown on the About tab
+ABOUT_TEXT = """
+CleanShift is a comprehensive system cleanup and optimization tool designed to:
+
+• Clean temporary files, cache, and system junk
+• Analyze disk usage and suggest optimizations  
+• Move applications to free up C: drive space
+• Manage development environments
+• Optimize system performance
+
+Features:
+✓ Safe file operations with preview mode
+✓ Intelligent application moving with symlinks
+✓ Development environment cleanup
+✓ Modern, intuitive interface
+✓ System-wide installation option
+
+Created with ❤️ for Windows users who want to keep their systems clean and optimized.
+"""
+
+# Cleaning options shown on the Clean tab: (label, key, description)
+CLEAN_OPTIONS = (
+    ("Temporary Files", "temp_files", "Clean system and user temp files"),
+    ("Browser Cache", "browser_cache", "Clear browser cache files"),
+    ("System Cache", "system_cache", "Clear Windows system cache"),
+    ("Recycle Bin", "recycle_bin", "Empty recycle bin"),
+)
+
+class DriveCard(tk.Frame):
+    """Dashboard card showing the usage of one drive"""
+    
+    # Fonts shared by every card, created along with the first one
+    _font_big = None
+    _font_medium = None
+    _font_small = None
+    
+    def __init__(self, parent, colors):
+        super().__init__(parent, bg=colors['white'], 
+                         relief='solid', borderwidth=1, padx=15, pady=15)
+        # Fixed size, so changing label text doesn't relayout the dashboard
+        self.pack_propagate(False)
+        self.colors = colors
+        
+        if DriveCard._font_big is None:
+            DriveCard._font_big = tkfont.Font(family='Arial', size=16, weight='bold')
+            DriveCard._font_medium = tkfont.Font(family='Arial', size=12)
+            DriveCard._font_small = tkfont.Font(family='Arial', size=10)
+        
+        # Drive letter
+        self.letter_label = tk.Label(self, font=self._font_big, 
+                                     fg=colors['gray_800'], bg=colors['white'])
+        # Usage percentage
+        self.usage_label = tk.Label(self, font=self._font_medium, bg=colors['white'])
+        # Size info
+        self.free_label = tk.Label(self, font=self._font_small, 
+                                   fg=colors['gray_600'], bg=colors['white'])
+        self.total_label = tk.Label(self, font=self._font_small, 
+                                    fg=colors['gray_600'], bg=colors['white'])
+        
+        for label in (self.letter_label, self.usage_label, self.free_label, self.total_label):
+            label.pack()
+        
+        # Size the card from the font metrics, so large DPI scaling doesn't clip the text
+        label = self.letter_label
+        px = self.winfo_pixels
+        label_x = 2 * (px(label.cget('borderwidth')) + px(label.cget('padx')))
+        label_y = 2 * (px(label.cget('borderwidth')) + px(label.cget('pady')))
+        frame_x = 2 * (px(self.cget('borderwidth')) + px(self.cget('padx')))
+        frame_y = 2 * (px(self.cget('borderwidth')) + px(self.cget('pady')))
+        
+        text_width = max(self._font_big.measure("C:\\"), 
+                         self._font_medium.measure("100.0% Used"), 
+                         self._font_small.measure("Total: 1023.9 GB"))
+        text_height = (self._font_big.metrics('linespace') + 
+                       self._font_medium.metrics('linespace') + 
+                       2 * self._font_small.metrics('linespace'))
+        self.config(width=max(200, text_width + label_x + frame_x), 
+                    height=max(140, text_height + 4 * label_y + frame_y))
+    
+    def show(self, drive_info):
+        """Display drive_info on the card"""
+        usage = drive_info['usage_percent']
+        
+        self.letter_label.config(text=drive_info['drive'])
+        self.usage_label.config(text=f"{usage:.1f}% Used", fg=self._usage_color(usage))
+        self.free_label.config(text=f"Free: {format_size(drive_info['free'])}")
+        self.total_label.config(text=f"Total: {format_size(drive_info['total'])}")
+    
+    def _usage_color(self, usage):
+        """Pick the status color for a drive usage percentage"""
+        if usage > 90:
+            return self.colors['danger']
+        if usage > 75:
+            return self.colors['warning']
+        return self.colors['success']
 
 class CleanShiftGUI:
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("CleanShift - System Cleanup & Optimizer")
-        self.root.geometry("1200x800")
+        self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
         self.root.configure(bg="#f8fafc")
         
         # Set window icon
-        try:
-            if getattr(sys, 'frozen', False):
-                # Running as executable
-                icon_path = os.path.join(sys._MEIPASS, 'assets', 'icon.ico')
-            else:
-                icon_path = os.path.join(os.path.dirname(__file__), '..', 'assets', 'icon.ico')
-            
-            if os.path.exists(icon_path):
-                self.root.iconbitmap(icon_path)
-        except:
-            pass  # Ignore if icon not found
+        icon_path = get_asset_path('icon.ico')
+        if icon_path:
+            try:
+                self.root.iconbitmap(str(icon_path))
+            except tk.TclError:
+                pass  # Ignore if icon can't be loaded
         
         # Modern color scheme (Tailwind-inspired)
         self.colors = {
@@ -68,10 +172,23 @@ class CleanShiftGUI:
         
         # GUI state variables
         self.clean_vars = {}
-        self.scan_path = tk.StringVar(value="C:\\")
+        self.scan_path = tk.StringVar(value=SYSTEM_DRIVE + "\\")
         self.auto_clean = tk.BooleanVar()
         self.confirm_actions = tk.BooleanVar(value=True)
         
+        # Dashboard drive cards, reused across refreshes
+        self._drive_cards = []
+        # (monotonic time, drive list) of the last get_drive_info() call
+        self._drives_cache = (0.0, None)
+        # Queue of the analysis currently feeding the results tree
+        self._analysis_queue = None
+        # Set to stop the analysis worker that feeds _analysis_queue
+        self._analysis_cancel = threading.Event()
+        # Column and direction (descending?) of the last results sort
+        self._results_sort = (None, False)
+        # (path, values) rows of the current analysis, in display order
+        self._scan_results = []
+        
         self.setup_styles()
         self.create_widgets()
         self.check_admin_status()
@@ -240,14 +357,7 @@ class CleanShiftGUI:
                 bg=self.colors['white']).pack(anchor='w', pady=(0, 10))
         
         # Create checkboxes for cleaning options
-        options = [
-            ("Temporary Files", "temp_files", "Clean system and user temp files"),
-            ("Browser Cache", "browser_cache", "Clear browser cache files"),
-            ("System Cache", "system_cache", "Clear Windows system cache"),
-            ("Recycle Bin", "recycle_bin", "Empty recycle bin")
-        ]
-        
-        for option_text, option_key, description in options:
+        for option_text, option_key, description in CLEAN_OPTIONS:
             option_frame = tk.Frame(clean_frame, bg=self.colors['white'])
             option_frame.pack(fill='x', pady=2)
             
@@ -304,17 +414,38 @@ class CleanShiftGUI:
                   style='Primary.TButton',
                   command=self.start_analysis).pack(side='left')
         
+        ttk.Button(path_frame, text="Rescan", 
+                  command=lambda: self.start_analysis(use_cache=False)).pack(side='left', padx=(5, 0))
+        
         # Results area
         results_frame = tk.Frame(tab_frame, bg=self.colors['white'], 
                                 relief='solid', borderwidth=1)
         results_frame.pack(fill='both', expand=True, padx=20, pady=(0, 20))
         
-        # Results text area
-        self.results_text = tk.Text(results_frame, height=20, width=80)
-        results_scroll = tk.Scrollbar(results_frame, command=self.results_text.yview)
-        self.results_text.config(yscrollcommand=results_scroll.set)
-        
-        self.results_text.pack(side='left', fill='both', expand=True, padx=10, pady=10)
+        self.results_status = tk.Label(results_frame, text="", 
+                                       font=('Arial', 10), 
+                                       fg=self.colors['gray_600'], 
+                                       bg=self.colors['white'])
+        self.results_status.pack(anchor='w', padx=10, pady=(10, 0))
+        
+        # Results tree
+        self.results_tree = ttk.Treeview(results_frame, style='Modern.Treeview',
+                                         columns=RESULT_COLUMNS,
+                                         displaycolumns=("size", "type", "suggestion"))
+        for column, heading in (("#0", "Path"), ("size", "Size"), 
+                                ("type", "Type"), ("suggestion", "Suggestion")):
+            self.results_tree.heading(column, text=heading, 
+                                      command=lambda c=column: self.sort_results(c))
+        self.results_tree.column("#0", width=450)
+        self.results_tree.column("size", width=100, anchor='e')
+        self.results_tree.column("type", width=150)
+        self.results_tree.column("suggestion", width=250)
+        
+        results_scroll = ttk.Scrollbar(results_frame, orient="vertical", command=self.results_tree.yview)
+        self.results_tree.configure(yscrollcommand=results_scroll.set)
+        self.results_tree.bind("<Double-1>", self.open_result_folder)
+        
+        self.results_tree.pack(side='left', fill='both', expand=True, padx=10, pady=10)
         results_scroll.pack(side='right', fill='y', pady=10)
     
     def create_about_tab(self):
@@ -336,26 +467,7 @@ class CleanShiftGUI:
                 fg=self.colors['gray_600'], 
                 bg=self.colors['white']).pack(pady=(0, 20))
         
-        about_text = """
-CleanShift is a comprehensive system cleanup and optimization tool designed to:
-
-• Clean temporary files, cache, and system junk
-• Analyze disk usage and suggest optimizations  
-• Move applications to free up C: drive space
-• Manage development environments
-• Optimize system performance
-
-Features:
-✓ Safe file operations with preview mode
-✓ Intelligent application moving with symlinks
-✓ Development environment cleanup
-✓ Modern, intuitive interface
-✓ System-wide installation option
-
-Created with ❤️ for Windows users who want to keep their systems clean and optimized.
-        """
-        
-        tk.Label(about_frame, text=about_text, 
+        tk.Label(about_frame, text=ABOUT_TEXT, 
                 font=('Arial', 10), 
                 fg=self.colors['gray_700'], 
                 bg=self.colors['white'],
@@ -366,10 +478,10 @@ Created with ❤️ for Windows users who want to keep their systems clean and o
         links_frame.pack()
         
         ttk.Button(links_frame, text="GitHub Repository", 
-                  command=lambda: webbrowser.open("https://github.com/theaathish/CleanShift")).pack(side='left', padx=(0, 10))
+                  command=lambda: self.open_url("https://github.com/theaathish/CleanShift")).pack(side='left', padx=(0, 10))
         
         ttk.Button(links_frame, text="Report Issue", 
-                  command=lambda: webbrowser.open("https://github.com/theaathish/CleanShift/issues")).pack(side='left')
+                  command=lambda: self.open_url("https://github.com/theaathish/CleanShift/issues")).pack(side='left')
     
     # Callback methods
     def check_admin_status(self):
@@ -382,49 +494,36 @@ Created with ❤️ for Windows users who want to keep their systems clean and o
     def refresh_dashboard(self):
         """Refresh dashboard data"""
         def update_drives():
-            # Clear existing drive cards
-            for widget in self.drives_container.winfo_children():
-                widget.destroy()
+            # Get drive info, reusing a recent result
+            now = time.monotonic()
+            cached_at, drives = self._drives_cache
+            if drives is None or now - cached_at >= DRIVES_CACHE_TTL:
+                drives = self.analyzer.get_drive_info()
+                self._drives_cache = (now, drives)
             
-            # Get drive info
-            drives = self.analyzer.get_drive_info()
-            
-            for i, drive in enumerate(drives):
-                self.create_drive_card(self.drives_container, drive, i)
+            self.root.after(0, self.update_drive_cards, drives)
         
         threading.Thread(target=update_drives, daemon=True).start()
     
-    def create_drive_card(self, parent, drive_info, index):
-        """Create a drive status card"""
-        card = tk.Frame(parent, bg=self.colors['white'], 
-                       relief='solid', borderwidth=1, padx=15, pady=15)
-        card.grid(row=0, column=index, padx=10, sticky='ew')
-        
-        # Drive letter
-        tk.Label(card, text=drive_info['drive'], 
-                font=('Arial', 16, 'bold'), 
-                fg=self.colors['gray_800'], 
-                bg=self.colors['white']).pack()
-        
-        # Usage percentage
-        usage = drive_info['usage_percent']
-        color = self.colors['danger'] if usage > 90 else self.colors['warning'] if usage > 75 else self.colors['success']
-        
-        tk.Label(card, text=f"{usage:.1f}% Used", 
-                font=('Arial', 12), 
-                fg=color, 
-                bg=self.colors['white']).pack()
-        
-        # Size info
-        tk.Label(card, text=f"Free: {format_size(drive_info['free'])}", 
-                font=('Arial', 10), 
-                fg=self.colors['gray_600'], 
-                bg=self.colors['white']).pack()
+    def update_drive_cards(self, drives):
+        """Show drive status, reconfiguring existing cards instead of rebuilding them"""
+        for index, drive_info in enumerate(drives):
+            if index == len(self._drive_cards):
+                self._drive_cards.append(self.create_drive_card(self.drives_container, index))
+            
+            card = self._drive_cards[index]
+            card.show(drive_info)
+            card.grid()
         
-        tk.Label(card, text=f"Total: {format_size(drive_info['total'])}", 
-                font=('Arial', 10), 
-                fg=self.colors['gray_600'], 
-                bg=self.colors['white']).pack()
+        # Hide cards for drives that are no longer present
+        for card in self._drive_cards[len(drives):]:
+            card.grid_remove()
+    
+    def create_drive_card(self, parent, index):
+        """Create an empty drive status card"""
+        card = DriveCard(parent, self.colors)
+        card.grid(row=0, column=index, padx=10, sticky='ew')
+        return card
     
     def quick_clean(self):
         """Perform quick cleanup"""
@@ -434,11 +533,13 @@ Created with ❤️ for Windows users who want to keep their systems clean and o
                 total_freed += self.cleaner.clean_temp_files()
                 total_freed += self.cleaner.clean_browser_cache()
                 
-                messagebox.showinfo("Success", 
-                                  f"Quick cleanup completed!\nFreed: {format_size(total_freed)}")
-                self.refresh_dashboard()
+                self.root.after(0, messagebox.showinfo, "Success", 
+                                f"Quick cleanup completed!\nFreed: {format_size(total_freed)}")
+                self._drives_cache = (0.0, None)  # Free space changed
+                clear_scan_cache()  # Folder sizes changed too
+                self.root.after(0, self.refresh_dashboard)
             except Exception as e:
-                messagebox.showerror("Error", f"Cleanup failed: {str(e)}")
+                self.root.after(0, messagebox.showerror, "Error", f"Cleanup failed: {str(e)}")
         
         if messagebox.askyesno("Confirm", "Perform quick cleanup of temporary files and browser cache?"):
             threading.Thread(target=cleanup, daemon=True).start()
@@ -461,20 +562,26 @@ Created with ❤️ for Windows users who want to keep their systems clean and o
         
         def cleanup():
             try:
-                total_freed = 0
+                tasks = {
+                    'temp_files': self.cleaner.clean_temp_files,
+                    'browser_cache': self.cleaner.clean_browser_cache,
+                    'system_cache': self.cleaner.clean_system_cache,
+                    'recycle_bin': self.cleaner.clean_recycle_bin,
+                }
                 
-                if 'temp_files' in selected:
-                    total_freed += self.cleaner.clean_temp_files()
-                if 'browser_cache' in selected:
-                    total_freed += self.cleaner.clean_browser_cache()
-                if 'system_cache' in selected:
-                    total_freed += self.cleaner.clean_system_cache()
+                # Each cleaner works on separate locations, so run them concurrently
+                with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                    futures = [executor.submit(clean) for option, clean in tasks.items() 
+                               if option in selected]
+                    total_freed = sum(future.result() for future in as_completed(futures))
                 
-                messagebox.showinfo("Success", 
-                                  f"Cleanup completed!\nFreed: {format_size(total_freed)}")
-                self.refresh_dashboard()
+                self.root.after(0, messagebox.showinfo, "Success", 
+                                f"Cleanup completed!\nFreed: {format_size(total_freed)}")
+                self._drives_cache = (0.0, None)  # Free space changed
+                clear_scan_cache()  # Folder sizes changed too
+                self.root.after(0, self.refresh_dashboard)
             except Exception as e:
-                messagebox.showerror("Error", f"Cleanup failed: {str(e)}")
+                self.root.after(0, messagebox.showerror, "Error", f"Cleanup failed: {str(e)}")
         
         threading.Thread(target=cleanup, daemon=True).start()
     
@@ -488,24 +595,19 @@ Created with ❤️ for Windows users who want to keep their systems clean and o
         
         def preview():
             try:
-                total_size = 0
-                details = []
-                
-                if 'temp_files' in selected:
-                    size = self.cleaner.clean_temp_files(dry_run=True)
-                    details.append(f"Temporary files: {format_size(size)}")
-                    total_size += size
-                if 'browser_cache' in selected:
-                    size = self.cleaner.clean_browser_cache(dry_run=True)
-                    details.append(f"Browser cache: {format_size(size)}")
-                    total_size += size
+                previews = (
+                    ('temp_files', "Temporary files", self.cleaner.clean_temp_files),
+                    ('browser_cache', "Browser cache", self.cleaner.clean_browser_cache),
+                )
+                pairs = [(label, clean(dry_run=True)) 
+                         for option, label, clean in previews if option in selected]
                 
-                preview_text = "\n".join(details)
-                preview_text += f"\n\nTotal space to be freed: {format_size(total_size)}"
+                preview_text = "\n".join(f"{label}: {format_size(size)}" for label, size in pairs)
+                preview_text += f"\n\nTotal space to be freed: {format_size(sum(size for _, size in pairs))}"
                 
-                messagebox.showinfo("Preview", preview_text)
+                self.root.after(0, messagebox.showinfo, "Preview", preview_text)
             except Exception as e:
-                messagebox.showerror("Error", f"Preview failed: {str(e)}")
+                self.root.after(0, messagebox.showerror, "Error", f"Preview failed: {str(e)}")
         
         threading.Thread(target=preview, daemon=True).start()
     
@@ -515,45 +617,153 @@ Created with ❤️ for Windows users who want to keep their systems clean and o
         if path:
             self.scan_path.set(path)
     
-    def start_analysis(self):
-        """Start disk analysis"""
+    def start_analysis(self, use_cache=True):
+        """Start disk analysis, streaming results into the tree as they are found"""
         path = self.scan_path.get()
         
+        self.results_tree.delete(*self.results_tree.get_children())
+        self.results_status.config(text=f"Analyzing {path}...")
+        # Show the finished scan largest first unless the user picks another sort
+        self._results_sort = ("size", True)
+        self._scan_results = []
+        
+        # Stop the previous scan so it neither feeds the tree nor saves its results
+        self._analysis_cancel.set()
+        cancel = threading.Event()
+        self._analysis_cancel = cancel
+        
+        results_queue = queue.Queue(maxsize=256)
+        self._analysis_queue = results_queue
+        
+        min_size = 50 * 1024 * 1024  # 50MB minimum
+        
+        def put(item):
+            # Nobody drains a superseded scan's queue, so never block on it for good
+            while not cancel.is_set():
+                try:
+                    results_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
         def analyze():
             try:
-                self.results_text.delete(1.0, tk.END)
-                self.results_text.insert(tk.END, f"Analyzing {path}...\n\n")
-                self.results_text.update()
-                
-                results = self.analyzer.scan_directory(path, 50 * 1024 * 1024)  # 50MB minimum
-                
-                self.results_text.delete(1.0, tk.END)
-                self.results_text.insert(tk.END, f"Analysis Results for {path}\n")
-                self.results_text.insert(tk.END, "=" * 50 + "\n\n")
-                
-                for result in results[:20]:  # Show top 20 results
-                    self.results_text.insert(tk.END, f"📁 {result['path']}\n")
-                    self.results_text.insert(tk.END, f"   Size: {format_size(result['size'])}\n")
-                    self.results_text.insert(tk.END, f"   Type: {result['type']}\n")
-                    self.results_text.insert(tk.END, f"   Suggestion: {self.get_suggestion(result)}\n\n")
-                
-                if len(results) > 20:
-                    self.results_text.insert(tk.END, f"... and {len(results) - 20} more folders\n")
+                # Reuse the last scan of this folder if nothing in it has changed
+                cached = load_scan_cache(path, min_size) if use_cache else None
+                if cached is not None:
+                    for result in cached:
+                        if not put(result):
+                            return
+                    put(None)
+                    return
                 
+                mtime_ns = os.stat(path).st_mtime_ns
+                results = []
+                for result in self.analyzer.iter_large_folders_parallel(path, min_size, cancel=cancel):
+                    results.append(result)
+                    if not put(result):
+                        break
+                if cancel.is_set():
+                    return
+                save_scan_cache(path, min_size, mtime_ns, results)
+                put(None)
             except Exception as e:
-                self.results_text.delete(1.0, tk.END)
-                self.results_text.insert(tk.END, f"Analysis failed: {str(e)}")
+                put(e)
         
         threading.Thread(target=analyze, daemon=True).start()
+        self.root.after(50, self._drain_results_queue, results_queue, path, 0)
+    
+    def _drain_results_queue(self, results_queue, path, count):
+        """Insert up to 100 queued results, rescheduling until the scan finishes"""
+        rows = []
+        result = None
+        finished = False
+        
+        for _ in range(100):
+            try:
+                result = results_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            if result is None or isinstance(result, Exception):
+                finished = True
+                break
+            
+            rows.append((result['path'], 
+                         (format_size(result['size']), 
+                          result['type'], 
+                          self.get_suggestion(result),
+                          result['size'])))
+        
+        # A newer analysis owns the tree and has already cancelled this one
+        if results_queue is not self._analysis_queue:
+            return
+        
+        self._scan_results.extend(rows)
+        bulk_insert(self.results_tree, rows)
+        count += len(rows)
+        
+        if not finished:
+            self.results_status.config(text=f"Analyzing {path}... {count} folders found")
+            self.root.after(50, self._drain_results_queue, results_queue, path, count)
+        elif result is None:
+            # Streamed rows arrive in walk order; sort them once at the end
+            self._apply_results_sort(*self._results_sort)
+            self.results_status.config(text=f"Analysis Results for {path}: {count} folders")
+        else:
+            self.results_status.config(text=f"Analysis failed: {str(result)}")
+    
+    def sort_results(self, column):
+        """Sort the results tree by column, toggling the order on repeated clicks"""
+        last_column, descending = self._results_sort
+        # Sizes sort largest first on the first click, text columns A-Z
+        descending = not descending if column == last_column else column == "size"
+        
+        try:
+            self._apply_results_sort(column, descending)
+        except Exception as e:
+            messagebox.showerror("Error", f"Sort failed: {str(e)}")
+    
+    def _apply_results_sort(self, column, descending):
+        """Sort the scan results by column and redraw the results tree"""
+        self._scan_results.sort(key=_row_sort_key(column), reverse=descending)
+        
+        # Rebuilding from the sorted rows takes two Tcl calls, where reordering
+        # the existing items would take one move per row
+        self.results_tree.delete(*self.results_tree.get_children())
+        bulk_insert(self.results_tree, self._scan_results)
+        
+        self._results_sort = (column, descending)
+    
+    def open_result_folder(self, event):
+        """Open the double-clicked result folder"""
+        iid = self.results_tree.identify_row(event.y)
+        if iid:
+            self.open_folder(self.results_tree.item(iid, "text"))
+    
+    def open_folder(self, folder_path):
+        """Open a folder in Explorer"""
+        try:
+            os.startfile(folder_path)
+        except OSError:
+            import subprocess
+            subprocess.Popen(["explorer", folder_path])
+    
+    def open_url(self, url):
+        """Open URL in default browser"""
+        # webbrowser is only needed from the About tab, so import it on demand
+        import webbrowser
+        webbrowser.open(url)
     
     def get_suggestion(self, folder_info):
         """Get suggestion for a folder"""
-        folder_type = folder_info['type'].lower()
+        keywords = suggestion_keywords(folder_info['type'])
         size = folder_info['size']
         
-        if 'cache' in folder_type:
+        if 'cache' in keywords:
             return "Safe to clean"
-        elif 'downloads' in folder_type and size > 1024*1024*1024:
+        elif 'downloads' in keywords and size > 1024*1024*1024:
             return "Review and clean old files"
         elif size > 5*1024*1024*1024:
             return "Consider moving to another drive"
@@ -562,10 +772,9 @@ Created with ❤️ for Windows users who want to keep their systems clean and o
     
     def run(self):
         """Run the GUI application"""
-        # Center the window
-        self.root.update_idletasks()
-        x = (self.root.winfo_screenwidth() // 2) - (self.root.winfo_width() // 2)
-        y = (self.root.winfo_screenheight() // 2) - (self.root.winfo_height() // 2)
-        self.root.geometry(f"+{x}+{y}")
+        # Center the window; its size is known, so no layout pass is needed first
+        x = (self.root.winfo_screenwidth() - WINDOW_WIDTH) // 2
+        y = (self.root.winfo_screenheight() - WINDOW_HEIGHT) // 2
+        self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}+{x}+{y}")
         
         self.root.mainloop()
\ No newline at end of file
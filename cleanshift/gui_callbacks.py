@@ -1,14 +1,44 @@
 import tkinter as tk
-from tkinter import messagebox, filedialog
+from tkinter import ttk, messagebox, filedialog
 import threading
 import webbrowser
 import subprocess
+import shutil
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+try:
+    from .utils import is_admin, format_size, get_available_drives, bulk_insert, \
+        clear_scan_cache, SYSTEM_DRIVE, suggestion_keywords
+    from .analyzer import get_tree_size
+except ImportError:
+    from utils import is_admin, format_size, get_available_drives, bulk_insert, \
+        clear_scan_cache, SYSTEM_DRIVE, suggestion_keywords
+    from analyzer import get_tree_size
+
+# Location of the system-wide install
+INSTALL_PATH = Path("C:/Program Files/CleanShift/cleanshift.exe")
+
+# Registry key holding one subkey per installed program
+UNINSTALL_KEY = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"
+
+# Checkbox glyphs for cleaning options listed in a Treeview
+CHECKED = "☑"
+UNCHECKED = "☐"
+
+# Smallest application folder worth offering to move
+MIN_MOVABLE_SIZE = 100 * 1024 * 1024
+
 class GUICallbacks:
     """Mixin class with GUI callback methods"""
     
+    # Cached result of _probe_install(), None until first checked
+    _install_cached = None
+    # Subkey names under UNINSTALL_KEY, enumerated once by _probe_install()
+    _uninstall_subkeys = None
+    
     def check_admin_status(self):
         """Check and display admin status"""
         if is_admin():
@@ -65,7 +95,7 @@ class GUICallbacks:
     
     def quick_clean(self):
         """Perform quick cleanup"""
-        if self.confirm_actions.get():
+        if self._confirm_actions:
             if not messagebox.askyesno("Confirm", "Perform quick cleanup of temporary files?"):
                 return
         
@@ -75,6 +105,7 @@ class GUICallbacks:
                 total_freed += self.cleaner.clean_temp_files()
                 total_freed += self.cleaner.clean_browser_cache()
                 
+                clear_scan_cache()  # Saved analysis sizes are out of date
                 messagebox.showinfo("Success", 
                                   f"Quick cleanup completed!\nFreed: {format_size(total_freed)}")
                 self.refresh_dashboard()
@@ -87,7 +118,7 @@ class GUICallbacks:
         """Perform quick disk analysis"""
         def analyze():
             try:
-                results = self.analyzer.scan_directory("C:\\", 100 * 1024 * 1024)
+                results = self.analyzer.scan_directory(SYSTEM_DRIVE + "\\", 100 * 1024 * 1024)
                 
                 # Switch to analyze tab and show results
                 self.notebook.select(2)  # Analyze tab
@@ -108,24 +139,41 @@ class GUICallbacks:
                 fg=self.colors['gray_800'], 
                 bg=self.colors['white']).pack(anchor='w', pady=(0, 10))
         
-        self.clean_vars = getattr(self, 'clean_vars', {})
+        # A single Treeview per section draws only its visible rows, unlike one
+        # Checkbutton + Label pair per option; the checkbox is a text glyph
+        options_tree = ttk.Treeview(section_frame, style='Modern.Treeview',
+                                    columns=("description",), show='tree',
+                                    height=len(options), selectmode='none')
+        options_tree.column("#0", width=220, stretch=False)
+        options_tree.column("description", width=400)
         
         for option_text, option_key, description in options:
-            option_frame = tk.Frame(section_frame, bg=self.colors['white'])
-            option_frame.pack(fill='x', pady=2)
+            # Reuse the option's variable when the section is rebuilt
+            var = self.clean_vars.get(option_key)
+            if var is None:
+                var = self.clean_vars[option_key] = tk.BooleanVar()
             
-            var = tk.BooleanVar()
-            self.clean_vars[option_key] = var
-            
-            cb = tk.Checkbutton(option_frame, text=option_text, 
-                               variable=var, bg=self.colors['white'],
-                               font=('Arial', 11))
-            cb.pack(side='left')
-            
-            tk.Label(option_frame, text=description, 
-                    font=('Arial', 9), 
-                    fg=self.colors['gray_600'], 
-                    bg=self.colors['white']).pack(side='left', padx=(10, 0))
+            glyph = CHECKED if var.get() else UNCHECKED
+            options_tree.insert("", "end", iid=option_key,
+                                text=f"{glyph} {option_text}",
+                                values=(description,))
+        
+        options_tree.bind("<Button-1>", 
+                          lambda e: self.toggle_clean_option(options_tree, e))
+        options_tree.pack(fill='x')
+    
+    def toggle_clean_option(self, options_tree, event):
+        """Toggle the cleaning option clicked in a section's Treeview"""
+        option_key = options_tree.identify_row(event.y)
+        if not option_key:
+            return
+        
+        var = self.clean_vars[option_key]
+        var.set(not var.get())
+        
+        option_text = options_tree.item(option_key, "text").split(" ", 1)[1]
+        glyph = CHECKED if var.get() else UNCHECKED
+        options_tree.item(option_key, text=f"{glyph} {option_text}")
     
     def clean_all_selected(self):
         """Clean all selected options"""
@@ -135,30 +183,32 @@ class GUICallbacks:
             messagebox.showwarning("Warning", "No cleaning options selected!")
             return
         
-        if self.confirm_actions.get():
+        if self._confirm_actions:
             if not messagebox.askyesno("Confirm", f"Clean {len(selected)} selected items?"):
                 return
         
         def cleanup():
             try:
-                total_freed = 0
-                
-                for option in selected:
-                    if option == 'clean_temp':
-                        total_freed += self.cleaner.clean_temp_files()
-                    elif option == 'clean_browser':
-                        total_freed += self.cleaner.clean_browser_cache()
-                    elif option == 'clean_system':
-                        total_freed += self.cleaner.clean_system_cache()
-                    elif option == 'clean_recycle':
-                        total_freed += self.cleaner.clean_recycle_bin()
+                tasks = {
+                    'clean_temp': self.cleaner.clean_temp_files,
+                    'clean_browser': self.cleaner.clean_browser_cache,
+                    'clean_system': self.cleaner.clean_system_cache,
+                    'clean_recycle': self.cleaner.clean_recycle_bin,
                     # Add more cleanup options as needed
+                }
                 
-                messagebox.showinfo("Success", 
-                                  f"Cleanup completed!\nFreed: {format_size(total_freed)}")
-                self.refresh_dashboard()
+                # Each cleaner works on separate locations, so run them concurrently
+                with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                    futures = [executor.submit(clean) for option, clean in tasks.items() 
+                               if option in selected]
+                    total_freed = sum(future.result() for future in as_completed(futures))
+                
+                clear_scan_cache()  # Saved analysis sizes are out of date
+                self.root.after(0, messagebox.showinfo, "Success", 
+                                f"Cleanup completed!\nFreed: {format_size(total_freed)}")
+                self.root.after(0, self.refresh_dashboard)
             except Exception as e:
-                messagebox.showerror("Error", f"Cleanup failed: {str(e)}")
+                self.root.after(0, messagebox.showerror, "Error", f"Cleanup failed: {str(e)}")
         
         threading.Thread(target=cleanup, daemon=True).start()
     
@@ -172,26 +222,20 @@ class GUICallbacks:
         
         def preview():
             try:
-                total_size = 0
-                details = []
-                
-                for option in selected:
-                    if option == 'clean_temp':
-                        size = self.cleaner.clean_temp_files(dry_run=True)
-                        details.append(f"Temporary files: {format_size(size)}")
-                        total_size += size
-                    elif option == 'clean_browser':
-                        size = self.cleaner.clean_browser_cache(dry_run=True)
-                        details.append(f"Browser cache: {format_size(size)}")
-                        total_size += size
+                previews = (
+                    ('clean_temp', "Temporary files", self.cleaner.clean_temp_files),
+                    ('clean_browser', "Browser cache", self.cleaner.clean_browser_cache),
                     # Add more preview options
+                )
+                pairs = [(label, clean(dry_run=True)) 
+                         for option, label, clean in previews if option in selected]
                 
-                preview_text = "\n".join(details)
-                preview_text += f"\n\nTotal space to be freed: {format_size(total_size)}"
+                preview_text = "\n".join(f"{label}: {format_size(size)}" for label, size in pairs)
+                preview_text += f"\n\nTotal space to be freed: {format_size(sum(size for _, size in pairs))}"
                 
-                messagebox.showinfo("Preview", preview_text)
+                self.root.after(0, messagebox.showinfo, "Preview", preview_text)
             except Exception as e:
-                messagebox.showerror("Error", f"Preview failed: {str(e)}")
+                self.root.after(0, messagebox.showerror, "Error", f"Preview failed: {str(e)}")
         
         threading.Thread(target=preview, daemon=True).start()
     
@@ -217,28 +261,26 @@ class GUICallbacks:
     def display_analysis_results(self, results):
         """Display analysis results in the treeview"""
         # Clear existing results
-        for item in self.analysis_tree.get_children():
-            self.analysis_tree.delete(item)
+        self.analysis_tree.delete(*self.analysis_tree.get_children())
         
         # Add results
-        for result in results:
-            suggestion = self.get_suggestion_for_folder(result)
-            self.analysis_tree.insert("", "end", 
-                                    text=result['path'],
-                                    values=(format_size(result['size']), 
-                                           result['type'], 
-                                           suggestion))
+        rows = [(result['path'], 
+                 (format_size(result['size']), 
+                  result['type'], 
+                  self.get_suggestion_for_folder(result)))
+                for result in results]
+        bulk_insert(self.analysis_tree, rows)
     
     def get_suggestion_for_folder(self, folder_info):
         """Get cleanup/optimization suggestion for a folder"""
-        folder_type = folder_info['type'].lower()
+        keywords = suggestion_keywords(folder_info['type'])
         size = folder_info['size']
         
-        if 'cache' in folder_type:
+        if 'cache' in keywords:
             return "Safe to clean"
-        elif 'downloads' in folder_type and size > 1024*1024*1024:  # > 1GB
+        elif 'downloads' in keywords and size > 1024*1024*1024:  # > 1GB
             return "Review and clean old files"
-        elif 'node' in folder_type:
+        elif 'node' in keywords:
             return "Consider moving to another drive"
         elif size > 5*1024*1024*1024:  # > 5GB
             return "Consider moving to another drive"
@@ -247,51 +289,80 @@ class GUICallbacks:
     
     def scan_movable_apps(self):
         """Scan for movable applications"""
+        # Clear existing results
+        self.movable_tree.delete(*self.movable_tree.get_children())
+        
         def scan():
             try:
-                # Clear existing results
-                for item in self.movable_tree.get_children():
-                    self.movable_tree.delete(item)
-                
                 # Scan for applications
                 apps = self.find_movable_applications()
                 
-                for app in apps:
-                    self.movable_tree.insert("", "end",
-                                           text=app['name'],
-                                           values=(format_size(app['size']),
-                                                  app['path'],
-                                                  app['target_drive'],
-                                                  app['status']))
+                rows = [(app['name'], 
+                         (format_size(app['size']),
+                          app['path'],
+                          app['target_drive'],
+                          app['status']))
+                        for app in apps]
+                self.root.after(0, bulk_insert, self.movable_tree, rows)
             except Exception as e:
-                messagebox.showerror("Error", f"Scan failed: {str(e)}")
+                self.root.after(0, messagebox.showerror, "Error", f"Scan failed: {str(e)}")
         
         threading.Thread(target=scan, daemon=True).start()
     
     def find_movable_applications(self):
         """Find applications that can be moved"""
-        # This would scan Program Files, AppData, etc. for large applications
-        # Return a list of dictionaries with app info
-        return []  # Placeholder implementation
+        local_app_data = os.environ.get('LOCALAPPDATA', '')
+        roots = [
+            os.environ.get('ProgramFiles', ''),
+            os.environ.get('ProgramFiles(x86)', ''),
+            os.path.join(local_app_data, 'Programs') if local_app_data else ''
+        ]
+        
+        app_dirs = []
+        for root in roots:
+            if not root or not os.path.isdir(root):
+                continue
+            try:
+                with os.scandir(root) as entries:
+                    # Skip symlinks, which include apps that were already moved
+                    app_dirs.extend(entry for entry in entries 
+                                    if entry.is_dir(follow_symlinks=False))
+            except (PermissionError, OSError):
+                continue
+        
+        # Sizing is I/O bound, so walk the application folders in parallel
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            sizes = list(executor.map(get_tree_size, [entry.path for entry in app_dirs]))
+        
+        target_drive = next((drive for drive in get_available_drives() 
+                             if not drive.upper().startswith(SYSTEM_DRIVE.upper())), None)
+        
+        apps = [{
+            'name': entry.name,
+            'size': size,
+            'path': entry.path,
+            'target_drive': target_drive or "N/A",
+            'status': "Ready to move" if target_drive else "No other drive"
+        } for entry, size in zip(app_dirs, sizes) if size >= MIN_MOVABLE_SIZE]
+        
+        return sorted(apps, key=lambda x: x['size'], reverse=True)
     
     def scan_environments(self):
         """Scan for development environments"""
         def scan():
             try:
                 # Clear existing results
-                for item in self.env_tree.get_children():
-                    self.env_tree.delete(item)
+                self.env_tree.delete(*self.env_tree.get_children())
                 
                 environments = self.env_cleaner.find_environments()
                 
-                for env in environments:
-                    action = "Clean" if env['size'] > 500*1024*1024 else "Review"
-                    self.env_tree.insert("", "end",
-                                       text=env['name'],
-                                       values=(env['type'],
-                                              format_size(env['size']),
-                                              env['path'],
-                                              action))
+                rows = [(env['name'], 
+                         (env['type'],
+                          format_size(env['size']),
+                          env['path'],
+                          "Clean" if env['size'] > 500*1024*1024 else "Review"))
+                        for env in environments]
+                bulk_insert(self.env_tree, rows)
             except Exception as e:
                 messagebox.showerror("Error", f"Environment scan failed: {str(e)}")
         
@@ -299,31 +370,63 @@ class GUICallbacks:
     
     def check_installation_status(self):
         """Check if CleanShift is installed to system"""
-        install_path = Path("C:/Program Files/CleanShift/cleanshift.exe")
-        if install_path.exists():
+        if self._install_cached is None:
+            self._install_cached = self._probe_install()
+        
+        if self._install_cached:
             self.install_status.config(text="✓ CleanShift is installed to system", 
                                      fg=self.colors['success'])
         else:
             self.install_status.config(text="⚠ CleanShift is not installed to system", 
                                      fg=self.colors['warning'])
     
+    def _probe_install(self):
+        """Look for the installed executable or a registered uninstall entry"""
+        if INSTALL_PATH.exists():
+            return True
+        
+        if self._uninstall_subkeys is None:
+            self._uninstall_subkeys = self._enum_uninstall_subkeys()
+        return any("CleanShift" in name for name in self._uninstall_subkeys)
+    
+    def _enum_uninstall_subkeys(self):
+        """List the program subkeys under UNINSTALL_KEY in one pass"""
+        try:
+            import winreg
+            
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, UNINSTALL_KEY) as key:
+                count = winreg.QueryInfoKey(key)[0]
+                return [winreg.EnumKey(key, i) for i in range(count)]
+        except (ImportError, OSError):
+            return []
+    
     def install_to_system(self):
         """Install CleanShift to system"""
         if not is_admin():
             messagebox.showerror("Error", "Administrator privileges required for installation!")
             return
         
-        try:
-            # Implementation would copy executable and update PATH
-            messagebox.showinfo("Success", "CleanShift installed to system successfully!")
-            self.check_installation_status()
-        except Exception as e:
-            messagebox.showerror("Error", f"Installation failed: {str(e)}")
+        def install():
+            try:
+                if not getattr(sys, 'frozen', False):
+                    raise RuntimeError("Installation requires the packaged executable")
+                
+                if INSTALL_PATH.exists() and INSTALL_PATH.samefile(sys.executable):
+                    raise RuntimeError("CleanShift is already running from the install location")
+                
+                INSTALL_PATH.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(sys.executable, INSTALL_PATH)
+                self._install_cached = True
+                self._uninstall_subkeys = None
+                
+                self.root.after(0, messagebox.showinfo, "Success", 
+                                "CleanShift installed to system successfully!")
+                self.root.after(0, self.check_installation_status)
+            except Exception as e:
+                self.root.after(0, messagebox.showerror, "Error", f"Installation failed: {str(e)}")
+        
+        threading.Thread(target=install, daemon=True).start()
     
     def open_url(self, url):
         """Open URL in default browser"""
         webbrowser.open(url)
-
-# Add callbacks to main GUI class
-from .gui import CleanShiftGUI
-CleanShiftGUI.__bases__ = CleanShiftGUI.__bases__ + (GUICallbacks,)
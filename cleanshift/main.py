@@ -1,15 +1,21 @@
 import sys
 import os
-import platform
 import tkinter as tk
 from tkinter import messagebox
 
+try:
+    from ._win32 import IS_WINDOWS
+except ImportError:
+    from _win32 import IS_WINDOWS
+
 def setup_imports():
     """Setup imports for standalone executable"""
     global DiskAnalyzer, SystemCleaner, PackageMover, EnvironmentCleaner, is_admin, format_size
     
+    frozen = getattr(sys, 'frozen', False)
+    
     # Add current directory to path for standalone builds
-    if getattr(sys, 'frozen', False):
+    if frozen:
         # Running as compiled executable
         bundle_dir = sys._MEIPASS
     else:
@@ -28,6 +34,9 @@ def setup_imports():
         from utils import is_admin, format_size
         return True
     except ImportError:
+        if frozen:
+            # Bundled modules are flat in _MEIPASS; relative imports can't find more
+            return False
         try:
             # Fallback with relative imports
             from .analyzer import DiskAnalyzer
@@ -60,7 +69,7 @@ def create_gui():
 
 def main():
     """Main entry point for GUI-only application"""
-    if platform.system() != "Windows":
+    if not IS_WINDOWS:
         root = tk.Tk()
         root.withdraw()
         messagebox.showwarning("Platform Warning", "CleanShift is designed for Windows systems.")
@@ -1,8 +1,145 @@
 import os
+import ctypes
 import shutil
-import subprocess
 from pathlib import Path
 
+try:
+    from . import _win32
+    from .utils import clear_scan_cache
+except ImportError:
+    import _win32
+    from utils import clear_scan_cache
+
+# MoveFileExW flags; REPLACE_EXISTING is left out since callers check first
+MOVEFILE_COPY_ALLOWED = 0x2
+MOVEFILE_WRITE_THROUGH = 0x8
+
+# Files at least this big bypass the cache manager when copied across drives
+LARGE_FILE_SIZE = 4 * 1024 * 1024
+COPY_FILE_NO_BUFFERING = 0x1000
+
+# CreateSymbolicLinkW flags
+SYMBOLIC_LINK_FLAG_DIRECTORY = 0x1
+SYMBOLIC_LINK_FLAG_ALLOW_UNPRIVILEGED_CREATE = 0x2
+ERROR_INVALID_PARAMETER = 87
+
+# CreateFileW / GetFinalPathNameByHandleW arguments for reading a link target
+FILE_SHARE_READ_WRITE = 0x3
+OPEN_EXISTING = 3
+FILE_FLAG_BACKUP_SEMANTICS = 0x02000000  # Needed to open a directory handle
+VOLUME_NAME_DOS = 0x0
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+def _copy_large_file(source: str, target: str) -> None:
+    """Copy a big file unbuffered so it doesn't flood the page cache"""
+    if _win32.IS_WINDOWS and _win32.CopyFile2 is not None:
+        params = _win32.COPYFILE2_EXTENDED_PARAMETERS(
+            dwSize=ctypes.sizeof(_win32.COPYFILE2_EXTENDED_PARAMETERS),
+            dwCopyFlags=COPY_FILE_NO_BUFFERING)
+        # CopyFile2 returns an HRESULT, 0 on success
+        if _win32.CopyFile2(source, target, ctypes.byref(params)) == 0:
+            return
+    
+    shutil.copy2(source, target)
+
+def _list_dir(directory: str) -> list:
+    """List a folder as (name, is_dir, is_link, size) tuples"""
+    if _win32.IS_WINDOWS:
+        try:
+            from ._winfind import iter_dir, is_link, FILE_ATTRIBUTE_DIRECTORY
+        except ImportError:
+            from _winfind import iter_dir, is_link, FILE_ATTRIBUTE_DIRECTORY
+        
+        # FindFirstFileExW hands back type and size with each name
+        return [(name, bool(attributes & FILE_ATTRIBUTE_DIRECTORY), is_link(attributes, tag),
+                 (size_high << 32) | size_low)
+                for name, attributes, size_high, size_low, tag in iter_dir(directory)]
+    
+    # DirEntry types come from the directory listing, so no stat per entry
+    with os.scandir(directory) as it:
+        return [(entry.name, entry.is_dir(), entry.is_symlink(),
+                 0 if entry.is_dir(follow_symlinks=False) else entry.stat(follow_symlinks=False).st_size)
+                for entry in it]
+
+def _walk_tree(path: str):
+    """Yield (directory, entries) for every folder in a tree, parents first"""
+    pending = [path]
+    
+    while pending:
+        directory = pending.pop()
+        entries = _list_dir(directory)
+        yield directory, entries
+        
+        pending.extend(os.path.join(directory, name) for name, is_dir, is_link, _ in entries
+                       if is_dir and not is_link)
+
+def _move_tree(source: str, target: str) -> None:
+    """Copy a folder to another drive file by file, then delete the original"""
+    copied_dirs = []
+    
+    for directory, entries in _walk_tree(source):
+        dst_dir = os.path.join(target, os.path.relpath(directory, source))
+        os.makedirs(dst_dir, exist_ok=True)
+        copied_dirs.append((directory, dst_dir))
+        
+        for name, is_dir, is_link, size in entries:
+            src = os.path.join(directory, name)
+            dst = os.path.join(dst_dir, name)
+            if is_link:
+                os.symlink(os.readlink(src), dst, target_is_directory=is_dir)
+            elif is_dir:
+                continue  # Created when the walk reaches it
+            elif size >= LARGE_FILE_SIZE:
+                _copy_large_file(src, dst)
+            else:
+                shutil.copy2(src, dst)
+    
+    # Children first, so creating their contents doesn't bump the copied times
+    for directory, dst_dir in reversed(copied_dirs):
+        shutil.copystat(directory, dst_dir)
+    
+    shutil.rmtree(source)
+
+def _readlink_target(path: str) -> str:
+    """Get the final target of a symlink with one handle open and one query"""
+    if not _win32.IS_WINDOWS:
+        return os.path.realpath(path)
+    
+    # Without FILE_FLAG_OPEN_REPARSE_POINT the handle lands on the link's target
+    handle = _win32.CreateFileW(path, 0, FILE_SHARE_READ_WRITE, None, OPEN_EXISTING,
+                                FILE_FLAG_BACKUP_SEMANTICS, None)
+    if handle is None or handle == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+    
+    try:
+        buffer = ctypes.create_unicode_buffer(32768)
+        length = _win32.GetFinalPathNameByHandleW(handle, buffer, len(buffer), VOLUME_NAME_DOS)
+        if not length:
+            raise ctypes.WinError(ctypes.get_last_error())
+    finally:
+        _win32.CloseHandle(handle)
+    
+    target = buffer.value
+    if target.startswith("\\\\?\\UNC\\"):
+        return "\\" + target[7:]
+    if target.startswith("\\\\?\\"):
+        return target[4:]
+    return target
+
+def _fast_move(source: str, target: str) -> None:
+    """Move a file or folder, letting Windows rename it in place when it can"""
+    if _win32.IS_WINDOWS:
+        # Same-volume moves are a single rename
+        if _win32.MoveFileExW(source, target, MOVEFILE_COPY_ALLOWED | MOVEFILE_WRITE_THROUGH):
+            return
+        
+        # Folders can't be moved across volumes by MoveFileEx; copy them over
+        if os.path.isdir(source) and not os.path.islink(source):
+            _move_tree(source, target)
+            return
+    
+    shutil.move(source, target)
+
 class PackageMover:
     """Handles moving packages/folders to other drives with symbolic links"""
     
@@ -23,6 +160,8 @@ class PackageMover:
                 print(f"Would create symlink: {source} -> {target_path}")
                 return True
             
+            source_str, target_str = str(source), str(target_path)
+            
             # Create target directory if it doesn't exist
             target_base.mkdir(exist_ok=True)
             
@@ -31,11 +170,15 @@ class PackageMover:
                 print(f"Target already exists: {target_path}")
                 return False
             
-            shutil.move(str(source), str(target_path))
+            _fast_move(source_str, target_str)
             
-            # Create symbolic link
-            self._create_symlink(str(target_path), str(source))
+            # Create symbolic link; without it the folder would just vanish from
+            # its old location, so put it back
+            if not self._create_symlink(target_str, source_str):
+                _fast_move(target_str, source_str)
+                return False
             
+            clear_scan_cache()  # Saved analysis sizes no longer match
             return True
             
         except Exception as e:
@@ -43,14 +186,29 @@ class PackageMover:
             return False
     
     def _create_symlink(self, target: str, link: str) -> bool:
-        """Create a symbolic link using mklink command"""
-        try:
-            cmd = ['mklink', '/D', link, target]
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            return result.returncode == 0
-        except Exception as e:
-            print(f"Error creating symlink: {e}")
-            return False
+        """Create a directory symbolic link with CreateSymbolicLinkW"""
+        if not _win32.IS_WINDOWS:
+            try:
+                os.symlink(target, link, target_is_directory=True)
+                return True
+            except OSError as e:
+                print(f"Error creating symlink: {e}")
+                return False
+        
+        # Unprivileged creation works in Developer Mode on Windows 10 1703+
+        if _win32.CreateSymbolicLinkW(link, target, SYMBOLIC_LINK_FLAG_DIRECTORY |
+                                      SYMBOLIC_LINK_FLAG_ALLOW_UNPRIVILEGED_CREATE):
+            return True
+        
+        # Older builds reject the unprivileged flag outright, so retry without it
+        error = ctypes.get_last_error()
+        if error == ERROR_INVALID_PARAMETER:
+            if _win32.CreateSymbolicLinkW(link, target, SYMBOLIC_LINK_FLAG_DIRECTORY):
+                return True
+            error = ctypes.get_last_error()
+        
+        print(f"Error creating symlink: {ctypes.WinError(error)}")
+        return False
     
     def restore_symlink(self, symlink_path: str, dry_run: bool = False) -> bool:
         """Restore a moved folder by removing symlink and moving back"""
@@ -61,7 +219,7 @@ class PackageMover:
                 return False
             
             # Get target path
-            target = link.resolve()
+            target = _readlink_target(str(link))
             
             if dry_run:
                 print(f"Would restore: {target} -> {link}")
@@ -71,8 +229,9 @@ class PackageMover:
             link.unlink()
             
             # Move folder back
-            shutil.move(str(target), str(link))
+            _fast_move(target, str(link))
             
+            clear_scan_cache()
             return True
             
         except Exception as e:
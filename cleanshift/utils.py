@@ -1,41 +1,170 @@
 import ctypes
+import json
 import os
+import re
+import sqlite3
+import sys
+import time
+from functools import lru_cache
+from pathlib import Path
 
+try:
+    from . import _win32
+except ImportError:
+    import _win32
+
+# Drive Windows is installed on, the one CleanShift frees space on
+SYSTEM_DRIVE = os.environ.get('SystemDrive', 'C:')
+
+# Seconds a drive listing from get_available_drives() is reused
+DRIVES_TTL = 5
+
+# Analysis results saved between runs, keyed by scan root and size threshold
+SCAN_CACHE_PATH = Path(os.environ.get('LOCALAPPDATA') or Path.home()) / 'CleanShift' / 'cache.db'
+# Entries are only checked against the scan root's mtime, which changes when a
+# direct child is added or removed but not for changes deeper in the tree.
+# Those go unnoticed until the entry is this many seconds old, or Rescan is used.
+SCAN_CACHE_MAX_AGE = 10 * 60
+
+@lru_cache(maxsize=1)
 def is_admin() -> bool:
     """Check if the current process has administrator privileges"""
     try:
-        return ctypes.windll.shell32.IsUserAnAdmin()
+        return bool(_win32.IsUserAnAdmin())
     except:
         return False
 
+_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+@lru_cache(maxsize=4096)
 def format_size(size_bytes: int) -> str:
     """Format bytes into human readable format"""
     if size_bytes == 0:
         return "0 B"
     
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
+    # Each unit is 2**10 of the previous one, so the bit length picks it directly
+    i = min((int(size_bytes).bit_length() - 1) // 10, len(_UNITS) - 1)
+    return f"{size_bytes / (1 << (i * 10)):.1f} {_UNITS[i]}"
+
+# Folder type keywords that drive the analysis suggestions
+SUGGESTION_KEYWORDS_RE = re.compile(r"cache|downloads|node")
+
+@lru_cache(maxsize=256)
+def suggestion_keywords(folder_type: str) -> frozenset:
+    """Find the suggestion keywords in a folder type with a single regex scan"""
+    return frozenset(SUGGESTION_KEYWORDS_RE.findall(folder_type.lower()))
+
+@lru_cache(maxsize=None)
+def get_asset_path(name: str):
+    """Get the path of a bundled asset, or None if it doesn't exist"""
+    if getattr(sys, 'frozen', False):
+        # Running as executable
+        assets_dir = Path(sys._MEIPASS) / 'assets'
+    else:
+        assets_dir = Path(__file__).parent.parent / 'assets'
     
-    return f"{size_bytes:.1f} {size_names[i]}"
+    path = assets_dir / name
+    return path if path.exists() else None
+
+def _same_path(a: str, b: str) -> bool:
+    """Compare two PATH entries, ignoring case, quotes and trailing separators"""
+    def normalize(p):
+        return os.path.normcase(p.strip().strip('"').rstrip('\\/'))
+    return normalize(a) == normalize(b)
+
+def add_path_entry(path_value: str, entry: str) -> str:
+    """Append entry to a semicolon-separated PATH value unless already present"""
+    entries = [p for p in path_value.split(";") if p]
+    if any(_same_path(p, entry) for p in entries):
+        return path_value
+    return ";".join(entries + [entry])
+
+def remove_path_entry(path_value: str, entry: str) -> str:
+    """Remove every occurrence of entry from a semicolon-separated PATH value"""
+    return ";".join(p for p in path_value.split(";") if p and not _same_path(p, entry))
+
+def get_cache() -> sqlite3.Connection:
+    """Open the scan cache database, creating it on first use"""
+    SCAN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(SCAN_CACHE_PATH), isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA mmap_size=67108864")
+    conn.execute("CREATE TABLE IF NOT EXISTS scan_cache ("
+                 "path TEXT, min_size INTEGER, mtime_ns INTEGER, saved_at REAL, results BLOB, "
+                 "PRIMARY KEY (path, min_size))")
+    return conn
+
+def _scan_cache_path(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+def load_scan_cache(path: str, min_size: int):
+    """Get saved analysis results for path, or None if missing, expired or the root changed"""
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+        conn = get_cache()
+        try:
+            row = conn.execute("SELECT mtime_ns, saved_at, results FROM scan_cache "
+                               "WHERE path = ? AND min_size = ?",
+                               (_scan_cache_path(path), min_size)).fetchone()
+        finally:
+            conn.close()
+    except (OSError, sqlite3.Error):
+        return None
+    
+    if (not row or row[0] != mtime_ns or 
+            time.time() - row[1] > SCAN_CACHE_MAX_AGE):
+        return None
+    return json.loads(row[2])
+
+def save_scan_cache(path: str, min_size: int, mtime_ns: int, results: list):
+    """Save analysis results for path, stamped with its mtime from before the scan"""
+    try:
+        conn = get_cache()
+        try:
+            conn.execute("INSERT OR REPLACE INTO scan_cache VALUES (?, ?, ?, ?, ?)",
+                         (_scan_cache_path(path), min_size, mtime_ns, time.time(),
+                          json.dumps(results).encode('utf-8')))
+        finally:
+            conn.close()
+    except (OSError, sqlite3.Error):
+        pass
+
+def clear_scan_cache():
+    """Forget all saved analysis results, e.g. after files were cleaned or moved"""
+    try:
+        conn = get_cache()
+        try:
+            conn.execute("DELETE FROM scan_cache")
+        finally:
+            conn.close()
+    except (OSError, sqlite3.Error):
+        pass
+
+# Tcl procedure inserting (text, values) pairs at the end of a Treeview
+_BULK_INSERT_PROC = "{w rows} {foreach {t v} $rows {$w insert {} end -text $t -values $v}}"
+
+def bulk_insert(tree, rows):
+    """Insert (text, values) rows at the end of a Treeview with a single Tcl call"""
+    if not rows:
+        return
+    
+    # Rows travel as call arguments, never as script text, so paths containing
+    # $, [ or unbalanced braces are inserted literally rather than substituted
+    flat = tuple(item for text, values in rows for item in (text, values))
+    tree.tk.call('apply', _BULK_INSERT_PROC, str(tree), flat)
 
 def get_available_drives():
     """Get list of available drives on Windows"""
-    import win32file
-    drives = []
-    drive_bits = win32file.GetLogicalDrives()
-    
-    for i in range(26):
-        mask = 1 << i
-        if drive_bits & mask:
-            drive_letter = chr(ord('A') + i) + ':\\'
-            try:
-                drive_type = win32file.GetDriveType(drive_letter)
-                if drive_type == win32file.DRIVE_FIXED:
-                    drives.append(drive_letter)
-            except:
-                continue
+    # The time bucket changes every DRIVES_TTL seconds, expiring the cached list
+    return list(_fixed_drives(int(time.monotonic() // DRIVES_TTL)))
+
+@lru_cache(maxsize=1)
+def _fixed_drives(bucket: int) -> tuple:
+    """Enumerate fixed drives; bucket only keys the cache"""
+    # One call returns every drive root as a NUL-separated list
+    buffer = ctypes.create_unicode_buffer(255)
+    length = _win32.GetLogicalDriveStringsW(len(buffer), buffer)
     
-    return drives
+    return tuple(drive for drive in buffer[:length].split('\0') 
+                 if drive and _win32.GetDriveTypeW(drive) == _win32.DRIVE_FIXED)
@@ -1,4 +1,4 @@
-from setuptools import setup, find_packages
+from setuptools import setup
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
@@ -7,12 +7,13 @@ setup(
     name="cleanshift",
     version="1.0.0",
     author="CleanShift Team",
-    description="CLI utility to clean and shift C drive content to other drives",
+    description="System Cleanup & Optimizer with modern GUI interface",
     long_description=long_description,
     long_description_content_type="text/markdown",
-    packages=find_packages(),
+    packages=["cleanshift"],
     classifiers=[
         "Development Status :: 4 - Beta",
+        "Environment :: Win32 (MS Windows)",
         "Intended Audience :: End Users/Desktop",
         "License :: OSI Approved :: MIT License",
         "Operating System :: Microsoft :: Windows",
@@ -24,15 +25,12 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[
-        "click>=8.0.0",
-        "psutil>=5.9.0",
-        "rich>=13.0.0",
-        "colorama>=0.4.6",
-        "pywin32>=306",
+        "pillow>=9.0.0",
+        "pywin32>=306; sys_platform == 'win32'",
     ],
     entry_points={
-        "console_scripts": [
-            "cleanshift=cleanshift.main:cli",
+        "gui_scripts": [
+            "cleanshift=cleanshift.main:main",
         ],
     },
 )